@@ -25,27 +25,157 @@
 Main file for the package
 """
 
+import itertools
+import os
 import re
-import uuid
-from collections import OrderedDict
-from copy import deepcopy
 
-from jsonschema import Draft7Validator
 from jsonschema.exceptions import best_match
 
 import toml
+import toml.ordered
 import yaml
-import yamlordereddictloader
-yaml.add_representer(OrderedDict, yaml.representer.Representer.represent_dict)
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# TOML parser implemented in the standard library (Python 3.11+) or its backport, if any.
+# toml is still used to render TOML, tomllib doesn't write.
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from .trees import empty_for, empty_like, fast_clone, remove_patterns, split_default_values
+from .validators import get_validators
+
+# Parsed schema files, keyed by path. Values are (stamp, schema, shared), see _load_schema().
+# shared holds what is built from the schema (validators, defaults), keyed by schema subtree.
+# Unlike configuration files, schemas are cached: they are loaded by every Config object
+# and what is built from them (validators, defaults) is the expensive part.
+_SCHEMA_CACHE = {}
+
+# Makes description keys unique, they only have to survive until config is rendered
+_DESCRIPTION_COUNTER = itertools.count()
+
+
+def _load_schema(filename):
+    """
+    Reads and parses the schema file, reusing the parsed schema if file didn't change.
+
+    Parsed schemas are shared between Config objects, so they must not be modified.
+    Along with the schema it returns a dictionary to keep what is built from it: it is
+    dropped together with the schema when the file changes.
+
+    A file is considered changed when its inode, size, mtime or ctime differ, so files
+    replaced by a new one (e.g. editors, deployment tools) are always reloaded. A file
+    rewritten in place with the same size within the timestamps resolution of the
+    filesystem is not noticed.
+
+    Parameters:
+    -----------
+    filename: str
+        Name (along with path) of the file containting the jsonschema specification formatted
+        in YAML.
+
+    Returns:
+    --------
+        tuple: Dictionary containing the json schema and dictionary of what is built from it
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+    try:
+        cached_stamp, schema, shared = _SCHEMA_CACHE[path]
+        if cached_stamp == stamp:
+            return schema, shared
+    except KeyError:
+        pass
+
+    # libyaml decodes UTF-8 itself and reads the file in chunks
+    with open(path, 'rb') as stream:
+        schema = yaml.load(stream, Loader=SafeLoader)
+    shared = {}
+    _SCHEMA_CACHE[path] = (stamp, schema, shared)
+
+    return schema, shared
+
+
+# Description keys are turned into comments when config is rendered.
+# The ones prefixed by "- " are list items. Bare text is only allowed for list items.
+_YAML_DESCRIPTION_RE = re.compile(
+    r"(?P<dash>- )?__syc_description_prefix__\S+?"
+    r"(?:: '(?P<quoted>.*)'|: (?P<value>.*)|(?(dash) (?P<text>.+)|(?!)))"
+)
+_TOML_DESCRIPTION_RE = re.compile(
+    r"(?P<dash>- )?__syc_description_prefix__\S+?"
+    r"(?: = '(?P<quoted>.*)'| = (?P<value>.*)|(?(dash) (?P<text>.+)|(?!)))"
+)
+
+
+def _description_to_comment(match):
+    """
+    Renders a description matched by one of the description regexes as a comment
+
+    Parameters:
+    -----------
+    match: re.Match
+        Match object returned by _YAML_DESCRIPTION_RE or _TOML_DESCRIPTION_RE
+
+    Returns:
+    --------
+        str: Comment
+    """
+    if match.group('text') is not None:
+        return f"# {match.group('text')}"
+    if match.group('quoted') is not None:
+        description = match.group('quoted')
+    else:
+        description = match.group('value')
+    if match.group('dash'):
+        return f"  # {description}"
+    return f"# {description}"
+
+
+def _schema_excerpt(schema, length=500):
+    """
+    Returns a short text representation of the schema, to be used in error messages
 
+    Parameters:
+    -----------
+    schema: dict
+        Dictionary containing the json schema
+    length: int
+        Maximum number of characters to return (default: 500)
+
+    Returns:
+    --------
+        str: Text representation of the schema
+    """
+    text = repr(schema)
+    if len(text) > length:
+        return text[:length] + '...'
+    return text
 
-class NoAliasDumper(yaml.Dumper):
-    """Wrapper around yaml.Dumper that statically disables aliases"""
+
+class NoAliasDumper(SafeDumper):
+    """Wrapper around SafeDumper that statically disables aliases"""
     def ignore_aliases(self, data):
         return True
 
 
-class Config():
+# Config may be set with subclasses of the builtin types (e.g. OrderedDict), render them as such
+NoAliasDumper.add_multi_representer(dict, SafeDumper.represent_dict)
+NoAliasDumper.add_multi_representer(list, SafeDumper.represent_list)
+NoAliasDumper.add_multi_representer(str, SafeDumper.represent_str)
+
+
+# Defaults made on first use (tree, values and commented config) each have their own attribute
+class Config():  # pylint: disable=too-many-instance-attributes
     """
     Validates configuration against the provided JSONSchema.
 
@@ -60,71 +190,46 @@ class Config():
             List of schema object names or id joined by '/'
             For instance /properties/listen/properties/.
             Allow user to import just a part of the schema (default: False)
+
+    The parsed schema, exposed as the schema attribute, is cached and shared by all of the
+    Config objects using the same file, as are the validators and default values built from it.
+    It must be treated as read-only: changes would leak into other Config objects.
     """
     def __init__(self, schema_filename, config=None, schema_subtree=False):
         # Init Schema and Validator from schema_filename
-        with open(schema_filename, encoding="utf-8") as stream:
-            try:
-                self.schema = yaml.load(stream, Loader=yamlordereddictloader.Loader)
-                # Allow user to consume just a substree in the schema file
-                if schema_subtree:
-                    for key in schema_subtree.split('/'):
-                        self.schema = self.schema[key]
-            except (yaml.scanner.ScannerError) as error:
-                raise RuntimeError(f'Error while parsing configuration file: {error}') from error
-        self.validator = Draft7Validator(self.schema)
-
-        ### I hate this hack and i should find a more elegant way to handle it ###
-
-        # Get default config (includes comments)
-        if self.schema['type'] == 'object':
-            empty_config = OrderedDict()
-        elif self.schema['type'] == 'array':
-            empty_config = []
-        else:
-            empty_config = None
-
-        self.__default_tree = self.__get_default_values(
-            self.schema,  with_description=False, with_title=False
-        )
-
-        default_values = self.__get_default_values(
-            self.schema,  with_description=True, with_title=True
-        )
-        # import json
-        # print(json.dumps(default_values, indent=2))
-        self.__default_config = self.__import_default_values(
-            config=deepcopy(empty_config),
-            default_values=default_values,
-            populate_arrays=True
-        )
-
-        default_values = self.__get_default_values(
-            self.schema,  with_description=False, with_title=False
-        )
-        self.__default_values = self.__import_default_values(
-            config=deepcopy(empty_config),
-            default_values=default_values,
-            populate_arrays=True
-        )
+        try:
+            self.schema, shared = _load_schema(schema_filename)
+            # Allow user to consume just a substree in the schema file
+            if schema_subtree:
+                for key in schema_subtree.split('/'):
+                    self.schema = self.schema[key]
+        except (yaml.scanner.ScannerError) as error:
+            raise RuntimeError(f'Error while parsing configuration file: {error}') from error
+        # Config objects using the same (sub)schema share what is built from it
+        self.__shared = shared.setdefault(schema_subtree, {})
+        self.validator, self.__fast_validator = get_validators(self.schema, self.__shared)
+
+        self.__schema_type = self.schema['type']
+
+        # Defaults are only made when they are needed, see the related methods below
+        self.__default_tree = None
+        self.__default_values = None
+        self.__default_config = None
 
         if config is None:
-            self.__config = deepcopy(self.__default_values)
+            self.__config = fast_clone(self.__get_shared_defaults()[1])
         else:
             self.config = config
 
-       ###########################################################################
-
-
     @staticmethod
     def __generate_description_prefix():
         """
-        Generates random strings used to make descriptions within internal data structure unique.
+        Generates strings used to make descriptions within internal data structure unique.
 
         Returns:
-          string: Random text
+          string: Unique text
         """
-        return f'__syc_description_prefix__{uuid.uuid4()}'
+        return f'__syc_description_prefix__{next(_DESCRIPTION_COUNTER)}'
 
     @property
     def config(self):
@@ -134,13 +239,37 @@ class Config():
     @config.setter
     def config(self, config):
         """ Set config object """
+        # Empty dicts (e.g. empty files) all end up the same, the import is made once per schema.
+        # Config is filled in place, as the import would do.
+        if isinstance(config, dict) and not config:
+            config.update(fast_clone(self.__get_shared_empty_config()))
+            self.__config = config
+            return
+
         # Import default values into config
         self.__config = self.__import_default_values(
-            config, self.__default_tree, populate_arrays=False
+            config, self.__get_default_tree(), populate_arrays=False
         )
 
     # Methods related to validation
 
+    def __fast_is_valid(self):
+        """
+        Checks config against the fastjsonschema validator, if any.
+
+        Returns:
+          bool: True if config is known to be valid, false if it has to be checked by jsonschema
+        """
+        if self.__fast_validator is None:
+            return False
+        try:
+            self.__fast_validator(self.config)
+        # Invalid config or code that fastjsonschema failed to generate properly
+        # (e.g. dates in the schema), either way jsonschema has the last word
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return True
+
     @property
     def is_valid(self):
         """
@@ -149,7 +278,7 @@ class Config():
         Returns:
           bool: True if string is valid, false otherwise
         """
-        return self.validator.is_valid(self.config)
+        return self.__fast_is_valid() or self.validator.is_valid(self.config)
 
     @property
     def validation_errors(self):
@@ -159,8 +288,12 @@ class Config():
         Returns:
           geneator: Collection of jsonschema.exceptions.ValidationError
         """
+        # Config known to be valid has no errors to look for
+        if self.__fast_is_valid():
+            return
+
         # Look for errors
-        yield self.validator.iter_errors(self.config)
+        yield from self.validator.iter_errors(self.config)
 
     def validate(self):
         """
@@ -170,13 +303,11 @@ class Config():
             RuntimeError: Text representation of the validation errors
         """
         def walk_path(config, path):
-            try:
-                item = path.popleft()
-                return walk_path(config[item], path)
-            except IndexError:
-                return config
+            for item in path:
+                config = config[item]
+            return config
 
-        error = best_match(self.validator.iter_errors(self.config))
+        error = best_match(self.validation_errors)
 
         if error:
             path = "Unknown"
@@ -207,49 +338,16 @@ Error while parsing configuration file.
             str: rendered text
         """
 
-        text = toml.dumps(data, encoder=toml.ordered.TomlOrderedEncoder())
-
-        # Handle descriptions
-        lines = []
-        for line in text.splitlines():
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+ = '(.*)'", r"  # \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+ = (.*)", r"  # \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+ (.+)", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
+        # Populated arrays can carry patternProperties keys, they can't be rendered
+        data = remove_patterns(data, walk_lists=True)
 
-            new_line = re.sub(
-                r"__syc_description_prefix__\S+ = '(.*)'", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"__syc_description_prefix__\S+ = (.*)", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
+        text = toml.dumps(data, encoder=toml.ordered.TomlOrderedEncoder())
 
-            lines.append(line)
+        # Handle descriptions, config and default values don't have any
+        if '__syc_description_prefix__' in text:
+            text = _TOML_DESCRIPTION_RE.sub(_description_to_comment, text)
 
-        return '\n'.join(lines) + '\n'
+        return text if text.endswith('\n') else text + '\n'
 
     def from_toml(self, text):
         """
@@ -259,7 +357,10 @@ Error while parsing configuration file.
         ----------
             text: Configuration text in TOML format
         """
-        self.config = toml.loads(text)
+        if tomllib is not None:
+            self.config = tomllib.loads(text)
+        else:
+            self.config = toml.loads(text)
 
     def to_toml(self):
         """ Returns rendered config object in TOML format """
@@ -273,8 +374,13 @@ Error while parsing configuration file.
         ----------
             filename: Nome of the TOML file containting configuration
         """
-        with open(filename, encoding="utf-8") as stream:
-            self.from_toml(stream.read())
+        if tomllib is not None:
+            # tomllib decodes UTF-8 itself
+            with open(filename, 'rb') as stream:
+                self.config = tomllib.load(stream)
+        else:
+            with open(filename, encoding="utf-8") as stream:
+                self.from_toml(stream.read())
 
     def to_toml_file(self, filename):
         """
@@ -300,6 +406,9 @@ Error while parsing configuration file.
             str: rendered text
         """
 
+        # Populated arrays can carry patternProperties keys, they can't be rendered
+        data = remove_patterns(data, walk_lists=True)
+
         text = yaml.dump(
             data,
             default_flow_style=False,
@@ -308,47 +417,11 @@ Error while parsing configuration file.
             Dumper=NoAliasDumper
         )
 
-        # Handle descriptions
-        lines = []
-        for line in text.splitlines():
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+: '(.*)'", r"  # \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+: (.*)", r"  # \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"- __syc_description_prefix__\S+ (.+)", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"__syc_description_prefix__\S+: '(.*)'", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
-
-            new_line = re.sub(
-                r"__syc_description_prefix__\S+: (.*)", r"# \1", line
-            )
-            if new_line != line:
-                lines.append(new_line)
-                continue
+        # Handle descriptions, config and default values don't have any
+        if '__syc_description_prefix__' in text:
+            text = _YAML_DESCRIPTION_RE.sub(_description_to_comment, text)
 
-            lines.append(line)
-
-        return '\n'.join(lines) + '\n'
+        return text if text.endswith('\n') else text + '\n'
 
     def from_yaml(self, text):
         """
@@ -356,9 +429,9 @@ Error while parsing configuration file.
 
         Parameters:
         ----------
-            text: Configuration text in YAML format
+            text: Configuration text in YAML format (str or UTF-8 encoded bytes)
         """
-        self.config = yaml.load(text, Loader=yaml.FullLoader) or {}
+        self.config = yaml.load(text, Loader=SafeLoader) or {}
 
     def to_yaml(self):
         """ Returns rendered config object in YAML format """
@@ -372,8 +445,9 @@ Error while parsing configuration file.
         ----------
             filename: Nome of the YAML file containting configuration
         """
-        with open(filename, encoding="utf-8") as stream:
-            self.from_yaml(stream.read())
+        # libyaml decodes UTF-8 itself and reads the file in chunks
+        with open(filename, 'rb') as stream:
+            self.config = yaml.load(stream, Loader=SafeLoader) or {}
 
     def to_yaml_file(self, filename):
         """
@@ -390,15 +464,96 @@ Error while parsing configuration file.
 
     def default_values(self):
         """ Returns default configuration as specified by the schema """
+        if self.__default_values is None:
+            self.__default_values = fast_clone(self.__get_shared_defaults()[1])
+
         return self.__default_values
 
     def default_config_to_yaml(self):
         """ Returns default configuration as specified by the schema formatted as YAML """
-        return self.__render_yaml(self.__default_config)
+        return self.__render_yaml(self.__get_default_config())
 
     def default_config_to_toml(self):
         """ Returns default configuration as specified by the schema formatted as TOML """
-        return self.__render_toml(self.__default_config)
+        return self.__render_toml(self.__get_default_config())
+
+    def __get_shared_defaults(self):
+        """
+        Returns default tree and default values as specified by the schema.
+        They only depend on the schema, so they are made once and shared between Config objects:
+        callers have to copy them before handing them out.
+
+        Returns:
+        --------
+            tuple: (default tree, default values)
+        """
+        try:
+            return self.__shared['defaults']
+        except KeyError:
+            pass
+
+        default_tree = self.__get_default_values(
+            self.schema,  with_description=False, with_title=False
+        )
+
+        # Default values are the same as the default tree, no need to walk the schema again
+        default_values = self.__import_default_values(
+            config=empty_for(self.__schema_type),
+            default_values=fast_clone(default_tree),
+            populate_arrays=True
+        )
+        self.__shared['defaults'] = (default_tree, default_values)
+
+        return default_tree, default_values
+
+    def __get_shared_empty_config(self):
+        """
+        Returns default tree imported into an empty dict, as the config setter would do.
+        It only depends on the schema, so it is made once and shared between Config objects:
+        callers have to copy it before handing it out.
+
+        Returns:
+        --------
+            mixed: Empty config with default values imported
+        """
+        try:
+            return self.__shared['empty_config']
+        except KeyError:
+            pass
+
+        empty_config = self.__import_default_values(
+            {}, fast_clone(self.__get_shared_defaults()[0]), populate_arrays=False
+        )
+        self.__shared['empty_config'] = empty_config
+
+        return empty_config
+
+    def __get_default_tree(self):
+        """
+        Returns default tree, used to import default values into config.
+        Config borrows from it, so each Config object gets its own copy. It is made on first use.
+        """
+        if self.__default_tree is None:
+            self.__default_tree = fast_clone(self.__get_shared_defaults()[0])
+
+        return self.__default_tree
+
+    def __get_default_config(self):
+        """
+        Returns default configuration, including descriptions, as specified by the schema.
+        It is made on first use.
+        """
+        if self.__default_config is None:
+            default_values = self.__get_default_values(
+                self.schema,  with_description=True, with_title=True
+            )
+            self.__default_config = self.__import_default_values(
+                config=empty_for(self.__schema_type),
+                default_values=default_values,
+                populate_arrays=True
+            )
+
+        return self.__default_config
 
     def __get_default_values(self, schema, with_description=False, with_title=False):
         """
@@ -416,49 +571,93 @@ Error while parsing configuration file.
         --------
             mixed: Default values
         """
-        # Get defaults from template
-        try:
-            default_values = schema['default']
+        # Rather than recursing into subschemas, containers are made with empty slots.
+        # Slots are queued along with their subschema and filled here.
+        default_values = [None]
+        pending = [(default_values, 0, schema, with_description, with_title)]
+        made = {}
+
+        while pending:
+            container, key, schema, with_description, with_title = pending.pop()
+            container[key] = self.__get_default_node(
+                schema, with_description, with_title, made, pending
+            )
 
-            # Default can be OrderedDict or list.
-            # In that case have to insert description
-            if isinstance(default_values, (dict, OrderedDict)):
-                if with_description and 'description' in schema:
-                    description_key = self.__generate_description_prefix()
-                    default_values[description_key] = schema['description']
-                    default_values.move_to_end(description_key, False)
-                if with_title and 'title' in schema:
-                    description_key = self.__generate_description_prefix()
-                    default_values[description_key] = schema['title']
-                    default_values.move_to_end(description_key, False)
-            elif isinstance(default_values, list):
-                if with_description and 'description' in schema:
-                    description_key = self.__generate_description_prefix()
-                    default_values = [f"{description_key} {schema['description']}"] + default_values
-                if with_title and 'title' in schema:
-                    description_key = self.__generate_description_prefix()
-                    default_values = [f"{description_key} {schema['title']}"] + default_values
-        except KeyError:
-            default_values = self.__make_default_values(
+        return default_values[0]
+
+    def __get_default_node(self, schema, with_description, with_title, made, pending):
+        """
+        Gets default values for a single node of the schema
+
+        Parameters:
+        -----------
+            schema: dict
+                Dictionary containing the json schema
+            with_description: bool
+                Wether or not include description from the schema
+            with_title: bool
+                Wether or not include title as description from the schema
+            made: dict
+                Default values made so far while walking the schema
+            pending: list
+                (container, key, subschema, with_description, with_title) slots still to be filled
+        Returns:
+        --------
+            mixed: Default values
+        """
+        # Make defaults if template doesn't provide them.
+        # The same subschema can be reached more than once (YAML aliases), make it only once.
+        # Slots are filled depth first, so by the time it is reached again it is complete.
+        if 'default' not in schema:
+            key = (id(schema), with_description, with_title)
+            if key in made:
+                return fast_clone(made[key])
+            made[key] = self.__make_default_values(
                 schema,
                 with_description,
-                with_title
+                with_title,
+                pending
             )
+            return made[key]
+
+        # Get defaults from template.
+        # Schema is shared between Config objects, so its values are not handed out
+        default_values = fast_clone(schema['default'])
+
+        # Default can be dict or list.
+        # In that case have to insert description
+        if isinstance(default_values, dict):
+            if with_description and 'description' in schema:
+                description_key = self.__generate_description_prefix()
+                default_values = {description_key: schema['description'], **default_values}
+            if with_title and 'title' in schema:
+                description_key = self.__generate_description_prefix()
+                default_values = {description_key: schema['title'], **default_values}
+        elif isinstance(default_values, list):
+            if with_description and 'description' in schema:
+                description_key = self.__generate_description_prefix()
+                default_values = [f"{description_key} {schema['description']}"] + default_values
+            if with_title and 'title' in schema:
+                description_key = self.__generate_description_prefix()
+                default_values = [f"{description_key} {schema['title']}"] + default_values
 
         return default_values
 
-    def __make_default_values(self, schema, with_description=False, with_title=False):
+    def __make_default_values(self, schema, with_description, with_title, pending):
         """
-        Parses schema and returns default values
+        Parses schema and returns default values.
+        Children are left empty and appended to pending, to be filled by the caller.
 
         Parameters:
         -----------
         schema: dict
             Dictionary containing the json schema
         with_description: bool
-            Wether or not include description from the schema (default: False)
+            Wether or not include description from the schema
         with_title: bool
-            Wether or not include title from the schema (default: False)
+            Wether or not include title from the schema
+        pending: list
+            (container, key, subschema, with_description, with_title) slots still to be filled
 
         Returns:
         --------
@@ -468,73 +667,62 @@ Error while parsing configuration file.
             raise RuntimeError(
 f"""Unable to infer default value from schema.
 Message: "type" keywords missing
-Schema: {self.__render_yaml(schema)}"""
+Schema: {_schema_excerpt(schema)}"""
             )
 
         # Parse objects
         if schema['type'] == 'object':
-            default_values = OrderedDict()
+            default_values = {}
 
             # Find all properties and patternPriorities
-            try:
-                properties = list(schema['properties'].items())
-            except KeyError:
-                properties = []
-            try:
-                for pattern, value in schema['patternProperties'].items():
-                    # Compile regex so that we can use it later
-                    pattern = re.compile(pattern)
-                    properties.append([pattern, value])
-            except KeyError:
-                pass
+            properties = list(schema.get('properties', {}).items())
+            for pattern, value in schema.get('patternProperties', {}).items():
+                # Compile regex so that we can use it later
+                pattern = re.compile(pattern)
+                properties.append([pattern, value])
 
             if not properties:
                 raise RuntimeError(
 f"""Error while parsing schema file.
 Message: Both "properties" and "patternPriorities" missing
-Schema {self.__render_yaml(schema)}"""
+Schema {_schema_excerpt(schema)}"""
 )
 
+            if with_title and 'title' in schema:
+                description_key = self.__generate_description_prefix()
+                default_values[description_key] = schema['title']
+
             # Loop over properties
             for _property, subschema in properties:
                 # Import description
-                if with_description:
-                    try:
-                        description_key = self.__generate_description_prefix()
-                        default_values[description_key] = subschema['description']
-                    except (TypeError, KeyError):
-                        pass
-
-                # Value might have children, so we run get_defaults over value
-                default_values[_property] = self.__get_default_values(
-                    subschema, with_description, False
-                )
+                if with_description and isinstance(subschema, dict) and 'description' in subschema:
+                    description_key = self.__generate_description_prefix()
+                    default_values[description_key] = subschema['description']
 
-            if with_title and 'title' in schema:
-                description_key = self.__generate_description_prefix()
-                default_values[description_key] = schema['title']
-                default_values.move_to_end(description_key, False)
+                # Value might have children, so it is filled later on
+                default_values[_property] = None
+                pending.append((default_values, _property, subschema, with_description, False))
 
             return default_values
 
         # Parse arrays
         if schema['type'] == 'array':
-            # Value might have children, so we run get_defaults over value
-            default_values = [self.__get_default_values(schema['items'], with_description, False)]
+            default_values = []
 
             if with_title and 'title' in schema:
                 description_key = self.__generate_description_prefix()
-                default_values = [f"{description_key} {schema['title']}"] + default_values
+                default_values.append(f"{description_key} {schema['title']}")
+
+            # Value might have children, so it is filled later on
+            default_values.append(None)
+            pending.append(
+                (default_values, len(default_values) - 1, schema['items'], with_description, False)
+            )
 
             return default_values
 
         # Fallback for all of the other objects
-        try:
-            default_values = schema['default']
-        except (TypeError, KeyError):
-            default_values = None
-
-        return default_values
+        return schema.get('default')
 
     def __import_default_values(self, config, default_values, populate_arrays=False):
         """
@@ -554,69 +742,83 @@ Schema {self.__render_yaml(schema)}"""
             mixed: Config with default values imported
         """
 
-        # Remove patternPriorities keys from default
-        def remove_patterns(tree):
-            if not isinstance(tree, (dict, OrderedDict)):
-                return tree
+        # Dicts are updated in place, so rather than recursing into them
+        # they are queued along with their default values and walked here.
+        # Default values that went through remove_patterns are flagged as clean,
+        # there is no need to look for patterns within them again.
+        pending = []
+        config = self.__import_default_node(
+            config, default_values, populate_arrays, pending, clean=False
+        )
 
-            clean_tree = OrderedDict()
-            for key, value in tree.items():
-                if isinstance(key, re.Pattern):
-                    continue
-                if isinstance(value, (dict, OrderedDict)):
-                    value = remove_patterns(value)
-                clean_tree[key] = value
+        while pending:
+            node, default_values, clean = pending.pop()
 
-            return clean_tree
+            # Schema doesn't describe an object here, nothing to import
+            if not isinstance(default_values, dict):
+                continue
 
-        # Handle dicts
-        if isinstance(config, (dict, OrderedDict)):
-            # Recursively import defaults into existing keys
-            for key, value in config.items():
+            # Import defaults into existing keys
+            for key, value in node.items():
                 if isinstance(key, re.Pattern):
                     continue
-                try:
-                    config[key] = self.__import_default_values(
-                        value, default_values[key], populate_arrays
-                    )
-                except KeyError:
-                    # Unexpected keys
+                # Unexpected keys
+                if key not in default_values:
                     continue
+                node[key] = self.__import_default_node(
+                    value, default_values[key], populate_arrays, pending, clean
+                )
 
-            # Recursively import defaults into keys that match with patterns (patternPriorities)
-            for pattern, default_value in default_values.items():
-                if not isinstance(pattern, re.Pattern):
-                    continue
-                for key, value in config.items():
-                    if pattern.match(key):
-                        # Import default_value into value
-                        config[key] = self.__import_default_values(
-                            value, default_value, populate_arrays
-                        )
+            # Split patterns (patternPriorities) from keys missing in config
+            patterns, missing = split_default_values(node, default_values, clean)
+
+            # Import defaults into keys that match with patterns (patternPriorities).
+            # Config keys are walked once, each one is checked against all of the patterns.
+            if patterns:
+                for key, value in node.items():
+                    for match, default_value in patterns:
+                        if match(key):
+                            # Import default_value into value
+                            value = node[key] = self.__import_default_node(
+                                value, default_value, populate_arrays, pending, clean=False
+                            )
 
             # Import missing keys
-            for key, default_value in default_values.items():
-                # Skip existing keys
-                if key in config:
-                    continue
+            for key, default_value in missing:
+                if not clean:
+                    default_value = remove_patterns(default_value)
 
-                # Skip patterns (patternPriorities)
-                if isinstance(key, re.Pattern):
-                    continue
+                node[key] = self.__import_default_node(
+                    empty_like(default_value), default_value, populate_arrays, pending, clean=True
+                )
 
-                default_value = remove_patterns(default_value)
+        return config
 
-                if isinstance(default_value, (dict, OrderedDict)):
-                    empty_config = OrderedDict()
-                elif isinstance(default_value, list):
-                    empty_config = []
-                else:
-                    empty_config = None
+    def __import_default_node(self, config, default_values, populate_arrays, pending, clean):
+        """
+        Imports default values into a single node of config.
+        Dicts are returned as they are and appended to pending, to be walked by the caller.
 
-                config[key] = self.__import_default_values(
-                    empty_config, default_value, populate_arrays
-                )
+        Parameters:
+        -----------
+        config: mixed
+            Configuration node to import values into
+        default_values: mixed
+            Default values to be imported into the node
+        populate_arrays: bool
+            Forces function to populate empty arrays
+        pending: list
+            (dict, default values, clean) tuples still to be walked
+        clean: bool
+            Wether or not default values are known to be free of patterns
 
+        Returns:
+        --------
+            mixed: Node with default values imported
+        """
+        # Handle dicts
+        if isinstance(config, dict):
+            pending.append((config, default_values, clean))
             return config
 
         # Handle lists
@@ -635,20 +837,18 @@ Schema {self.__render_yaml(schema)}"""
                         description = default_value
                         default_value = default_values[1]
             except (StopIteration, IndexError):
-                if isinstance(item, (dict, OrderedDict)):
-                    default_value = OrderedDict()
-                elif isinstance(item, list):
-                    default_value = []
-                else:
-                    default_value = None
+                default_value = empty_like(default_item)
 
+            # remove_patterns doesn't walk lists, items can still have patterns
             for item in config:
-                item = self.__import_default_values(item, default_value, populate_arrays)
+                self.__import_default_node(
+                    item, default_value, populate_arrays, pending, clean=False
+                )
 
             # Populate array with default value
             if populate_arrays and default_value is not None:
-                config = [self.__import_default_values(
-                    default_item, default_value, populate_arrays)
+                config = [self.__import_default_node(
+                    default_item, default_value, populate_arrays, pending, clean=False)
                 ]
 
             # Add description
@@ -0,0 +1,156 @@
+# MIT License
+
+# Copyright (c) 2021, Marco Marzetti <marco@lamehost.it>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Helpers to handle configuration and default values trees
+"""
+
+import re
+from copy import deepcopy
+
+
+def fast_clone(tree):
+    """
+    Returns a copy of the tree. Faster than deepcopy for the plain dicts, lists and scalars
+    that make up configurations and default values, falls back to deepcopy for anything else.
+
+    Parameters:
+    -----------
+    tree: mixed
+        Tree to be copied
+
+    Returns:
+    --------
+        mixed: Copy of the tree
+    """
+    # Exact types on purpose: subclasses (e.g. OrderedDict) are left to deepcopy to keep their type
+    if type(tree) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {key: fast_clone(value) for key, value in tree.items()}
+    if type(tree) is list:  # pylint: disable=unidiomatic-typecheck
+        return [fast_clone(item) for item in tree]
+    if tree is None or isinstance(tree, (str, int, float)):
+        return tree
+    return deepcopy(tree)
+
+
+def empty_for(schema_type):
+    """
+    Returns a new empty configuration for the given schema type
+
+    Parameters:
+    -----------
+    schema_type: str
+        Value of the 'type' keyword of the schema
+
+    Returns:
+    --------
+        mixed: Empty dict for objects, empty list for arrays, None otherwise
+    """
+    if schema_type == 'object':
+        return {}
+    if schema_type == 'array':
+        return []
+    return None
+
+
+def empty_like(value):
+    """
+    Returns a new empty configuration of the same type as value
+
+    Parameters:
+    -----------
+    value: mixed
+        Default values or configuration node
+
+    Returns:
+    --------
+        mixed: Empty dict for dicts, empty list for lists, None otherwise
+    """
+    if isinstance(value, dict):
+        return {}
+    if isinstance(value, list):
+        return []
+    return None
+
+
+def split_default_values(node, default_values, clean):
+    """
+    Splits default values into patterns (patternPriorities) and keys missing in node
+
+    Parameters:
+    -----------
+    node: dict
+        Configuration node to import default values into
+    default_values: dict
+        Default values to be imported into the node
+    clean: bool
+        Wether or not default values are known to be free of patterns
+
+    Returns:
+    --------
+        tuple: List of (pattern match method, default value) and list of (key, default value)
+    """
+    if clean:
+        return [], [(key, value) for key, value in default_values.items() if key not in node]
+
+    # Patterns are kept as their bound match method, it is looked up only once
+    patterns = []
+    missing = []
+    for key, value in default_values.items():
+        if isinstance(key, re.Pattern):
+            patterns.append((key.match, value))
+        elif key not in node:
+            missing.append((key, value))
+
+    return patterns, missing
+
+
+def remove_patterns(tree, walk_lists=False):
+    """
+    Returns a copy of the tree without patternProperties keys
+
+    Parameters:
+    -----------
+    tree: mixed
+        Default values
+    walk_lists: bool
+        Wether or not remove patterns from list items as well (default: False)
+
+    Returns:
+    --------
+        mixed: Default values without compiled patterns as keys
+    """
+    if walk_lists and isinstance(tree, list):
+        return [remove_patterns(item, walk_lists) for item in tree]
+    if not isinstance(tree, dict):
+        return tree
+
+    clean_tree = {}
+    for key, value in tree.items():
+        if isinstance(key, re.Pattern):
+            continue
+        if isinstance(value, (dict, list)):
+            value = remove_patterns(value, walk_lists)
+        clean_tree[key] = value
+
+    return clean_tree
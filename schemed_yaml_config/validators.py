@@ -0,0 +1,137 @@
+# MIT License
+
+# Copyright (c) 2021, Marco Marzetti <marco@lamehost.it>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Builds the validators for a schema
+"""
+
+from jsonschema import (
+    Draft3Validator,
+    Draft4Validator,
+    Draft6Validator,
+    Draft7Validator,
+    Draft201909Validator,
+    Draft202012Validator
+)
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Keywords fastjsonschema and jsonschema don't always agree on (e.g. multipleOf on floats).
+# Schemas using them are validated by jsonschema alone.
+_FAST_UNSAFE_KEYWORDS = frozenset(['multipleOf'])
+
+# Validator classes, keyed by the "$schema" URI of their draft (without the empty fragment)
+_VALIDATOR_CLASSES = {
+    cls.META_SCHEMA.get('$id', cls.META_SCHEMA.get('id', '')).rstrip('#'): cls
+    for cls in (
+        Draft3Validator,
+        Draft4Validator,
+        Draft6Validator,
+        Draft7Validator,
+        Draft201909Validator,
+        Draft202012Validator
+    )
+}
+
+
+def _fast_validation_is_safe(schema):
+    """
+    Tells whether fastjsonschema can be trusted to accept configurations for the schema
+
+    Parameters:
+    -----------
+    schema: dict
+        Dictionary containing the json schema
+
+    Returns:
+    --------
+        bool: False if schema uses any of the keywords in _FAST_UNSAFE_KEYWORDS
+    """
+    pending = [schema]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            if not _FAST_UNSAFE_KEYWORDS.isdisjoint(node):
+                return False
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+
+    return True
+
+
+def get_validators(schema, shared):
+    """
+    Returns validators for the schema, reusing the compiled ones when available.
+
+    The validator class is picked from the "$schema" keyword. Draft 7 is used when it is
+    missing or it doesn't name a known draft (e.g. "http://json-schema.org/schema#").
+    The schema is checked against the metaschema only once, when the validators
+    are first built. If fastjsonschema is installed the schema is also compiled into
+    a plain Python function, which is used to accept valid configurations quickly.
+    That only happens when its verdict matches jsonschema's, see _fast_validation_is_safe().
+
+    Parameters:
+    -----------
+    schema: dict
+        Dictionary containing the json schema
+    shared: dict
+        Objects built from the schema, validators are kept here
+
+    Returns:
+    --------
+        tuple: jsonschema validator and fastjsonschema validator (None if not available)
+    """
+    try:
+        return shared['validators']
+    except KeyError:
+        pass
+
+    uri = schema.get('$schema')
+    cls = Draft7Validator
+    if isinstance(uri, str):
+        cls = _VALIDATOR_CLASSES.get(uri.rstrip('#'), Draft7Validator)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    fast_validator = None
+    # fastjsonschema only implements drafts 4, 6 and 7
+    if (
+            fastjsonschema is not None
+            and cls in (Draft4Validator, Draft6Validator, Draft7Validator)
+            and _fast_validation_is_safe(schema)
+        ):
+        try:
+            # Formats are not asserted by jsonschema validators either
+            fast_validator = fastjsonschema.compile(
+                schema, use_default=False, use_formats=False
+            )
+        # fastjsonschema is just an accelerator: whatever it fails on is left to jsonschema
+        except Exception:  # pylint: disable=broad-except
+            fast_validator = None
+
+    shared['validators'] = (validator, fast_validator)
+    return shared['validators']
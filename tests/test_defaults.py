@@ -0,0 +1,211 @@
+"""
+Pins default values, commented default configuration and config merging
+"""
+
+import pytest
+
+from schemed_yaml_config import Config
+
+
+PATTERNS_SCHEMA = """
+type: object
+properties:
+  name:
+    type: string
+    description: Name of the service
+    default: web
+  hosts:
+    type: object
+    patternProperties:
+      "^h[0-9]+$":
+        type: object
+        properties:
+          port: {type: integer, default: 80}
+          tls: {type: boolean, default: false}
+  servers:
+    type: array
+    title: Servers
+    description: Backend servers
+    items:
+      type: object
+      properties:
+        address: {type: string, default: 127.0.0.1}
+      patternProperties:
+        "^x-":
+          type: string
+          default: ext
+"""
+
+ALIASES_SCHEMA = """
+definitions:
+  endpoint: &endpoint
+    type: object
+    description: Endpoint
+    properties:
+      host: {type: string, description: Host name, default: localhost}
+      port: {type: integer, default: 8080}
+type: object
+title: Aliases
+properties:
+  primary: *endpoint
+  secondary: *endpoint
+"""
+
+TEMPLATES_SCHEMA = """
+type: object
+properties:
+  options:
+    type: object
+    title: Options
+    description: Free form options
+    default: {retries: 3, verbose: false}
+  tags:
+    type: array
+    title: Tags
+    description: List of tags
+    items: {type: string}
+    default: [a, b]
+  limits:
+    type: object
+    properties:
+      soft: {type: integer, default: 10}
+      hard: {type: integer, default: 20}
+"""
+
+
+@pytest.fixture(name='schema_file')
+def fixture_schema_file(tmp_path):
+    """ Returns a function writing a schema to a file and returning its name """
+    def write(text, name='schema.yml'):
+        path = tmp_path / name
+        path.write_text(text, encoding='utf-8')
+        return str(path)
+    return write
+
+
+def test_patterns_default_values(schema_file):
+    """ patternProperties don't make defaults on their own, not even under array items """
+    default_values = Config(schema_file(PATTERNS_SCHEMA)).default_values()
+
+    assert default_values['name'] == 'web'
+    assert default_values['hosts'] == {}
+    # Items carry the patternProperties defaults too, only plain keys are pinned here
+    item = default_values['servers'][0]
+    assert {key: value for key, value in item.items() if isinstance(key, str)} == {
+        'address': '127.0.0.1'
+    }
+
+
+def test_patterns_default_config(schema_file):
+    """ Pattern keys are not rendered """
+    assert Config(schema_file(PATTERNS_SCHEMA)).default_config_to_yaml() == (
+        "# Name of the service\n"
+        "name: web\n"
+        "hosts: {}\n"
+        "# Backend servers\n"
+        "servers:\n"
+        "- address: 127.0.0.1\n"
+    )
+
+
+def test_patterns_merge(schema_file):
+    """ Keys matching patterns get the pattern defaults, array items get the item defaults """
+    config = Config(schema_file(PATTERNS_SCHEMA), config={
+        'hosts': {'h1': {'port': 443}, 'other': {}},
+        'servers': [{'address': '10.0.0.1'}, {'x-a': 'v'}]
+    })
+
+    assert config.config == {
+        'hosts': {'h1': {'port': 443, 'tls': False}, 'other': {}},
+        'servers': [{'address': '10.0.0.1'}, {'x-a': 'v', 'address': '127.0.0.1'}],
+        'name': 'web'
+    }
+
+
+def test_aliases_default_values(schema_file):
+    """ Aliased subschemas make independent defaults """
+    default_values = Config(schema_file(ALIASES_SCHEMA)).default_values()
+
+    assert default_values == {
+        'primary': {'host': 'localhost', 'port': 8080},
+        'secondary': {'host': 'localhost', 'port': 8080}
+    }
+    assert default_values['primary'] is not default_values['secondary']
+
+
+def test_aliases_default_config(schema_file):
+    """ Descriptions of aliased subschemas are rendered for each of them """
+    assert Config(schema_file(ALIASES_SCHEMA)).default_config_to_yaml() == (
+        "# Aliases\n"
+        "# Endpoint\n"
+        "primary:\n"
+        "  # Host name\n"
+        "  host: localhost\n"
+        "  port: 8080\n"
+        "# Endpoint\n"
+        "secondary:\n"
+        "  # Host name\n"
+        "  host: localhost\n"
+        "  port: 8080\n"
+    )
+
+
+def test_aliases_merge(schema_file):
+    """ Merging into one aliased subschema doesn't touch the other one """
+    config = Config(schema_file(ALIASES_SCHEMA), config={'primary': {'port': 1}})
+
+    assert config.config == {
+        'primary': {'port': 1, 'host': 'localhost'},
+        'secondary': {'host': 'localhost', 'port': 8080}
+    }
+
+
+def test_templates_default_values(schema_file):
+    """ Template defaults are used as they are, arrays are populated with their first item """
+    assert Config(schema_file(TEMPLATES_SCHEMA)).default_values() == {
+        'options': {'retries': 3, 'verbose': False},
+        'tags': ['a'],
+        'limits': {'soft': 10, 'hard': 20}
+    }
+
+
+def test_templates_default_config(schema_file):
+    """ Descriptions of template defaults (dicts and arrays) are rendered as comments """
+    assert Config(schema_file(TEMPLATES_SCHEMA)).default_config_to_yaml() == (
+        "# Free form options\n"
+        "options:\n"
+        "  # Free form options\n"
+        "  retries: 3\n"
+        "  verbose: false\n"
+        "# List of tags\n"
+        "tags:\n"
+        "# List of tags\n"
+        "- a\n"
+        "limits:\n"
+        "  soft: 10\n"
+        "  hard: 20\n"
+    )
+
+
+def test_templates_merge(schema_file):
+    """ Template defaults don't leak descriptions into config, arrays are not populated """
+    config = Config(schema_file(TEMPLATES_SCHEMA), config={
+        'options': {'retries': 5}, 'limits': {'soft': 1}
+    })
+
+    assert config.config == {
+        'options': {'retries': 5, 'verbose': False},
+        'limits': {'soft': 1, 'hard': 20},
+        'tags': []
+    }
+
+
+def test_defaults_are_not_shared(schema_file):
+    """ Changing config doesn't change defaults of other Config objects using the same schema """
+    filename = schema_file(TEMPLATES_SCHEMA)
+    first = Config(filename)
+    first.config['options']['retries'] = 0
+    first.default_values()['limits']['soft'] = 0
+
+    assert Config(filename).config['options']['retries'] == 3
+    assert Config(filename).default_values()['limits']['soft'] == 10
@@ -0,0 +1,49 @@
+"""
+Validation results must not depend on whether fastjsonschema is installed
+"""
+
+import pytest
+
+from schemed_yaml_config import Config
+
+
+MULTIPLE_OF_SCHEMA = """
+type: object
+properties:
+  ratio:
+    type: number
+    multipleOf: 0.1
+    default: 0.5
+  count:
+    type: number
+    multipleOf: 3
+    default: 3
+"""
+
+
+@pytest.fixture(name='schema_filename')
+def fixture_schema_filename(tmp_path):
+    """ Writes the multipleOf schema to a file """
+    path = tmp_path / 'schema.yml'
+    path.write_text(MULTIPLE_OF_SCHEMA, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('config', [{'ratio': 0.3}, {'count': 1e308}])
+def test_multiple_of_is_checked_by_jsonschema(schema_filename, config):
+    """ fastjsonschema accepts these, jsonschema doesn't """
+    config = Config(schema_filename, config=config)
+
+    assert not config.is_valid
+    assert list(config.validation_errors)
+    with pytest.raises(RuntimeError, match='multiple of'):
+        config.validate()
+
+
+def test_multiple_of_valid_config(schema_filename):
+    """ Configurations jsonschema accepts are still valid """
+    config = Config(schema_filename, config={'ratio': 0.5, 'count': 9})
+
+    assert config.is_valid
+    assert not list(config.validation_errors)
+    config.validate()